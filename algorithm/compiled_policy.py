@@ -0,0 +1,113 @@
+import os
+import json
+from checkers_env.win_config import Win_Config
+from checkers_env.piece import Piece
+from checkers_env.board import Board
+from checkers_env.game_log import Game_Logger
+from algorithm.q_learning import Q_Learning
+
+class Compiled_Policy:
+    """Greedy Q-learning policy compiled to a state key -> best action lookup (player 1).
+
+    Every state of the Q-table is resolved ahead of time exactly like
+    Q_Learning.get_best_action(is_training=False) would, so playing a known
+    state is a dict lookup and an in place move. Unseen states use the
+    fallback: the greedy choice of an empty Q-table (the first valid action)
+    or, if given, a Minimax instance playing as player 1.
+    """
+    def __init__(self, policy: dict[str, list], board_size: int=Win_Config.NO_OF_ROWS, mandatory_capture: bool=False, fallback=None) -> None:
+        # state -> [action, captured squares]
+        self.policy = policy
+        self.board_size = board_size
+        self.mandatory_capture = mandatory_capture
+        self.fallback = fallback
+
+    @staticmethod
+    def policy_file_for(q_table_file: str, mandatory_capture: bool=False) -> str:
+        """Compiled policies live next to their Q-table (the legal moves depend on mandatory captures)."""
+        return os.path.splitext(q_table_file)[0] + ("_policy_mc.json" if mandatory_capture else "_policy.json")
+
+    @classmethod
+    def compile(cls, q_learning: Q_Learning, board_size: int=Win_Config.NO_OF_ROWS, mandatory_capture: bool=False, fallback=None) -> 'Compiled_Policy':
+        """Resolve the greedy action of every state in the Q-table."""
+        policy = {}
+        for state, q_values in q_learning.q_table.items():
+            if len(state) != board_size * board_size or not q_values:
+                continue
+            board = Board.decode(state, mandatory_capture)
+            best_q_value = -float("inf")
+            best = None
+            # same order and tie breaking as Q_Learning.get_best_action
+            for piece, actions in board.get_all_actions(Piece.P1).items():
+                for action, skipped in actions.items():
+                    action_key = q_learning._encode_action(piece.row, piece.col, action[0], action[1])
+                    q_value = q_values.get(action_key, 0.0)
+                    if q_value > best_q_value:
+                        best_q_value = q_value
+                        best = [action_key, [[p.row, p.col] for p in skipped]]
+            if best:
+                policy[state] = best
+        return cls(policy, board_size, mandatory_capture, fallback)
+
+    def save(self, policy_file: str) -> None:
+        """Save the compiled policy to a JSON file."""
+        with open(policy_file, mode='w') as file:
+            json.dump({"board_size": self.board_size, "mandatory_capture": self.mandatory_capture, "policy": self.policy}, file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, policy_file: str, fallback=None) -> 'Compiled_Policy':
+        """Load a compiled policy from a JSON file."""
+        with open(policy_file, mode='r') as file:
+            data = json.load(file)
+        return cls(data["policy"], data["board_size"], data["mandatory_capture"], fallback)
+
+    @classmethod
+    def load_or_compile(cls, q_table_file: str | None=None, board_size: int=Win_Config.NO_OF_ROWS, mandatory_capture: bool=False, fallback=None) -> 'Compiled_Policy':
+        """Load the compiled policy of a Q-table, (re)compiling it when missing or older than the Q-table."""
+        q_table_file = q_table_file or Q_Learning.q_table_file_for(board_size)
+        policy_file = cls.policy_file_for(q_table_file, mandatory_capture)
+        if os.path.exists(policy_file) and (not os.path.exists(q_table_file) or os.path.getmtime(policy_file) >= os.path.getmtime(q_table_file)):
+            try:
+                return cls.load(policy_file, fallback)
+            except (json.JSONDecodeError, KeyError, IOError):
+                pass
+        policy = cls.compile(Q_Learning(epsilon=0.0, q_table_file=q_table_file), board_size, mandatory_capture, fallback)
+        if os.path.exists(q_table_file):
+            try:
+                policy.save(policy_file)
+            except IOError:
+                pass
+        return policy
+
+    def get_action(self, state: str) -> list | None:
+        """Return [action, captured squares] for a known state, None otherwise."""
+        return self.policy.get(state)
+
+    def play(self, board: Board) -> tuple[Board, str]:
+        """Play player 1's move, known states are played in place on the given board. Returns (board, action)."""
+        best = self.policy.get(board.encode())
+        if best is None:
+            return self._play_fallback(board)
+        action, captured = best
+        row, col, target_row, target_col = map(int, action.split(","))
+        skipped = [board.get_piece(r, c) for r, c in captured]
+        board.move_piece(board.get_piece(row, col), target_row, target_col)
+        if skipped:
+            board.remove_pieces(skipped)
+        return board, action
+
+    def _play_fallback(self, board: Board) -> tuple[Board, str]:
+        if self.fallback is not None:
+            new_board = self.fallback.get_best_action(board)
+            action, _ = Game_Logger.diff(board.encode(), new_board.encode(), "1")
+            return new_board, action
+        valid_actions = board.get_all_actions(Piece.P1)
+        if not valid_actions:
+            return board, ""
+        piece, actions = next(iter(valid_actions.items()))
+        (target_row, target_col), skipped = next(iter(actions.items()))
+        action = f"{piece.row},{piece.col},{target_row},{target_col}"
+        board.move_piece(piece, target_row, target_col)
+        if skipped:
+            board.remove_pieces(skipped)
+        return board, action
@@ -1,61 +1,102 @@
-from copy import deepcopy
 from checkers_env.color import Color
 from checkers_env.piece import Piece
 from checkers_env.board import Board
 
 class Minimax:
     """Class to implement the minimax algorithm with alpha-beta pruning."""
-    def __init__(self, depth: int=4) -> None:
+    # transposition table bounds
+    EXACT, LOWER, UPPER = 0, 1, 2
+
+    def __init__(self, depth: int=4, player: Color=Piece.P2, max_transpositions: int | None=None, transpositions: dict | None=None) -> None:
         self.depth = depth
+        # transposition table: None keeps it for a single search, otherwise it is kept
+        # across searches (e.g. by a long running worker) and bounded to this many entries
+        self.max_transpositions = max_transpositions
+        # a table passed in may be shared with other instances (of any depth and side) under one bound
+        self.transpositions = {} if transpositions is None else transpositions
+        # the side minimax plays as (maximizing player), player 2 by default
+        self.player = player
+        self.opponent = Piece.P1 if player == Piece.P2 else Piece.P2
 
     def get_best_action(self, board: Board) -> Board:
         """Get the best action for a given state."""
+        if self.max_transpositions is None:
+            self.transpositions = {}
         _, new_board = self.minimax(board, self.depth, float('-inf'), float('inf'), True)
+        if self.max_transpositions is None:
+            self.transpositions = {}
         return new_board
 
     def minimax(self, board: Board, depth: int, alpha: float, beta: float, maximizing_player: bool) -> tuple[int, Board]:
-        """Minimax algorithm with alpha-beta pruning to determine the best outcome for the AI."""
+        """Minimax algorithm with alpha-beta pruning to determine the best outcome for the AI.
+
+        The table only stores values, so below the root a transposition hit returns no outcome.
+        """
         if depth == 0 or board.winner() is not None:
-            return (-board.evaluate(), board)
+            return (self.score(board), board)
+
+        # positions reached through different move orders (or searched before) are only searched once
+        key = (board.encode(), depth, maximizing_player, self.player, board.mandatory_capture)
+        entry = self.transpositions.get(key)
+        if entry and depth < self.depth:
+            evaluation, bound = entry
+            if bound == self.EXACT or (bound == self.LOWER and evaluation >= beta) or (bound == self.UPPER and evaluation <= alpha):
+                return (evaluation, None)
+        alpha_orig, beta_orig = alpha, beta
         
         best_outcome = None
         if maximizing_player:
-            maxEval = float('-inf')
-            # player 2 is minimax algorithm (this will be used to train the model, Player 1 is the AI)
-            for outcome in self.get_all_outcomes(board, Piece.P2):
+            bestEval = float('-inf')
+            # player 2 is minimax algorithm by default (this will be used to train the model, Player 1 is the AI)
+            for outcome in self.get_all_outcomes(board, self.player):
                 evaluation, _ = self.minimax(outcome, depth - 1, alpha, beta, False)
-                if evaluation > maxEval:
-                    maxEval = evaluation
+                if evaluation > bestEval:
+                    bestEval = evaluation
                     best_outcome = outcome
                 alpha = max(alpha, evaluation)
                 if beta <= alpha:
                     break
-            return (maxEval, best_outcome)
         else:
-            minEval = float('inf')
-            for outcome in self.get_all_outcomes(board, Piece.P1):
+            bestEval = float('inf')
+            for outcome in self.get_all_outcomes(board, self.opponent):
                 evaluation, _ = self.minimax(outcome, depth - 1, alpha, beta, True)
-                if evaluation < minEval:
-                    minEval = evaluation
+                if evaluation < bestEval:
+                    bestEval = evaluation
                     best_outcome = outcome
                 beta = min(beta, evaluation)
                 if beta <= alpha:
                     break
-            return (minEval, best_outcome)
+
+        # a pruned search only gives a bound on the real value
+        if bestEval <= alpha_orig:
+            bound = self.UPPER
+        elif bestEval >= beta_orig:
+            bound = self.LOWER
+        else:
+            bound = self.EXACT
+        self.transpositions[key] = (bestEval, bound)
+        if self.max_transpositions is not None and len(self.transpositions) > self.max_transpositions:
+            # evict the oldest entry
+            del self.transpositions[next(iter(self.transpositions))]
+        return (bestEval, best_outcome)
+
+    def score(self, board: Board) -> float:
+        """Score a board from the point of view of the player minimax plays as."""
+        return -board.evaluate() if self.player == Piece.P2 else board.evaluate()
 
     def get_all_outcomes(self, board: Board, player: Color) -> list[Board]:
-        """Get all the possible outcomes for a given player."""
+        """Get all the possible outcomes for a given player, captures first (better pruning)."""
         outcomes = []
-        for piece in board.get_all_pieces(player):
-            actions = board.get_actions(piece)
+        for piece, actions in board.get_all_actions(player).items():
             for action, skip in actions.items():
                 new_board = self.simulate_action(piece, action, board, skip)
-                outcomes.append(new_board)
-        return outcomes
+                outcomes.append((len(skip), new_board))
+        outcomes.sort(key=lambda outcome: -outcome[0])
+        return [new_board for _, new_board in outcomes]
 
     def simulate_action(self, piece: Piece, action: tuple[int, int], board: Board, skip: list[Piece]) -> Board:
         """Simulate an action on a temporary/copy board."""
-        new_board = deepcopy(board)
+        new_board = board.copy()
         temp_piece = new_board.get_piece(piece.row, piece.col)
         new_board.move_piece(temp_piece, action[0], action[1])
         if skip:
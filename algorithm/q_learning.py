@@ -1,24 +1,33 @@
 import os
 import json
+import math
 import random
 from collections import defaultdict
-from copy import deepcopy
+from checkers_env.win_config import Win_Config
 from checkers_env.piece import Piece
 from checkers_env.board import Board
+from checkers_env.game_log import read_games
 
 class Q_Learning:
     """Class to implement the Q-learning algorithm."""
     Q_TABLE_FILE = "q_table.json"
     
-    def __init__(self, alpha: float=0.15, gamma: float=0.95, epsilon: float=0.8, q_table_file: str=Q_TABLE_FILE) -> None:
+    def __init__(self, alpha: float=0.15, gamma: float=0.95, epsilon: float=0.8, q_table_file: str | None=None, board_size: int=Win_Config.NO_OF_ROWS) -> None:
         self.alpha = alpha  # Learning rate (increased for faster learning)
         self.gamma = gamma  # Discount factor (increased to value future rewards more)
         self.epsilon = epsilon  # Exploration rate
-        self.q_table_file = q_table_file
+        self.q_table_file = q_table_file or self.q_table_file_for(board_size)
         self.q_table = defaultdict(lambda: defaultdict(float))
         self.load_q_table()
         self.move_count = 0
 
+    @classmethod
+    def q_table_file_for(cls, board_size: int) -> str:
+        """Q-tables are tagged with the board size, the 6x6 table keeps its original name."""
+        if board_size == 6:
+            return cls.Q_TABLE_FILE
+        return f"q_table_{board_size}x{board_size}.json"
+
     def load_q_table(self) -> None:
         """Load Q-table from JSON file."""
         if os.path.exists(self.q_table_file):
@@ -88,9 +97,8 @@ class Q_Learning:
     
     def get_best_action(self, state: Board, is_training: bool = True) -> tuple[Board, str]:
         """Get the best action for a given state. Returns (new_board, action_taken)."""
-        new_state = deepcopy(state)
-        pieces = new_state.get_all_pieces(Piece.P1)
-        valid_actions = {p: new_state.get_actions(p) for p in pieces if new_state.get_actions(p)}
+        new_state = state.copy()
+        valid_actions = new_state.get_all_actions(Piece.P1)
 
         if not valid_actions:
             return new_state, ""
@@ -137,3 +145,32 @@ class Q_Learning:
 
         self.move_count += 1
         return new_state, action_str
+
+    def _flip_action(self, action: str, size: int) -> str:
+        """Flip an encoded action to match a flipped board (see Board.flip)."""
+        return ",".join(str(size - 1 - int(value)) for value in action.split(","))
+
+    def train_from_log(self, log_file: str, passes: int=1, learn_p2: bool=False, board_size: int=Win_Config.NO_OF_ROWS) -> int:
+        """Run offline Q-learning passes over a game log, returns the number of updates.
+
+        P1 moves are learned as played, P2 moves (e.g. from minimax self-play) are
+        learned on the flipped board when learn_p2 is set. Games played on another
+        board size (the log is shared by every size) are skipped.
+        """
+        updates = 0
+        for _ in range(passes):
+            for game in read_games(log_file):
+                if len(game.final_state) != board_size * board_size:
+                    continue
+                states = [move.state for move in game.moves] + [game.final_state]
+                for i, move in enumerate(game.moves):
+                    if not move.action or (move.player == 2 and not learn_p2):
+                        continue
+                    state, action, next_state = move.state, move.action, states[i + 1]
+                    if move.player == 2:
+                        state, next_state = Board.flip_key(state), Board.flip_key(next_state)
+                        action = self._flip_action(action, math.isqrt(len(state)))
+                    reward = self._calculate_move_reward(Board.decode(state), Board.decode(next_state), bool(move.captures))
+                    self.update_q_value(state, action, reward, next_state)
+                    updates += 1
+        return updates
@@ -0,0 +1,258 @@
+import os
+import math
+import time
+import random
+import argparse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from checkers_env.win_config import Win_Config
+from checkers_env.color import Color
+from checkers_env.piece import Piece
+from checkers_env.board import Board
+from checkers_env.game import Game
+from checkers_env.game_log import Game_Logger
+from algorithm.minimax import Minimax
+from algorithm.compiled_policy import Compiled_Policy
+
+class Minimax_Agent:
+    """Minimax agent that can play either side of the board."""
+    # one transposition table per process, shared by every depth, side, board size and capture rule
+    # and kept across moves (and requests in the move server): about 64 MB at most on 8x8
+    MAX_TRANSPOSITIONS = 200_000
+    TRANSPOSITIONS = {}
+
+    def __init__(self, depth: int) -> None:
+        self.depth = depth
+        self.minimax = {player: Minimax(depth, player, self.MAX_TRANSPOSITIONS, self.TRANSPOSITIONS) for player in (Piece.P1, Piece.P2)}
+
+    def reset(self, seed: int) -> None:
+        """Minimax is deterministic, nothing to reset."""
+
+    def act(self, board: Board, player: Color) -> Board:
+        """Return the board after the agent's move."""
+        return self.minimax[player].get_best_action(board)
+
+class Q_Learning_Agent:
+    """Greedy (epsilon=0) Q-learning agent using the compiled policy, P2 is played on the flipped board."""
+    def __init__(self, q_table_file: str | None, board_size: int, mandatory_capture: bool) -> None:
+        self.policy = Compiled_Policy.load_or_compile(q_table_file, board_size, mandatory_capture)
+
+    def reset(self, seed: int) -> None:
+        """The greedy policy is deterministic, nothing to reset."""
+
+    def act(self, board: Board, player: Color) -> Board:
+        """Return the board after the agent's move."""
+        if player == Piece.P1:
+            new_board, _ = self.policy.play(board.copy())
+            return new_board
+        new_board, _ = self.policy.play(board.flip())
+        return new_board.flip()
+
+class Random_Agent:
+    """Agent that plays a uniformly random legal move."""
+    def __init__(self) -> None:
+        self.rng = random.Random()
+        self.minimax = Minimax(depth=0)
+
+    def reset(self, seed: int) -> None:
+        """Reseed the agent so every match is reproducible."""
+        self.rng.seed(seed)
+
+    def act(self, board: Board, player: Color) -> Board:
+        """Return the board after the agent's move."""
+        return self.rng.choice(self.minimax.get_all_outcomes(board, player))
+
+def make_agent(spec: str, board_size: int=Win_Config.NO_OF_ROWS, mandatory_capture: bool=False):
+    """Build an agent from a spec: 'minimax[:depth]', 'qlearning[:q_table_file]' or 'random'.
+
+    Without a file the Q-learning agent uses the Q-table of the board size.
+    """
+    kind, _, arg = spec.partition(":")
+    if kind == "minimax":
+        if not arg:
+            depth = 4
+        elif arg.lstrip("-").isdigit():
+            depth = int(arg)
+        else:
+            raise ValueError(f"Invalid minimax depth: {spec}")
+        # at depth 0 minimax returns the board unchanged and would pass every turn
+        if depth < 1:
+            raise ValueError(f"Minimax depth must be at least 1: {spec}")
+        return Minimax_Agent(depth)
+    if kind == "qlearning":
+        if arg and not os.path.exists(arg):
+            raise ValueError(f"Q-table file not found: {spec}")
+        return Q_Learning_Agent(arg or None, board_size, mandatory_capture)
+    if kind == "random":
+        return Random_Agent()
+    raise ValueError(f"Unknown agent spec: {spec}")
+
+# agents and loggers are built once per worker process (the Q-learning policy is only loaded once)
+_agents = {}
+_loggers = {}
+
+def get_agent(spec: str, board_size: int=Win_Config.NO_OF_ROWS, mandatory_capture: bool=False):
+    key = (spec, board_size, mandatory_capture)
+    if key not in _agents:
+        _agents[key] = make_agent(spec, board_size, mandatory_capture)
+    return _agents[key]
+
+def _get_logger(log_file: str | None) -> Game_Logger | None:
+    if log_file and log_file not in _loggers:
+        _loggers[log_file] = Game_Logger(log_file)
+    return _loggers.get(log_file)
+
+def play_match(p1_spec: str, p2_spec: str, seed: int, max_moves: int=200, opening_plies: int=2, log_file: str | None=None,
+               board_size: int=Win_Config.NO_OF_ROWS, mandatory_capture: bool=False) -> dict:
+    """Play one headless game and return the result with per-agent move timings."""
+    rng = random.Random(seed)
+    agents = {Piece.P1: get_agent(p1_spec, board_size, mandatory_capture), Piece.P2: get_agent(p2_spec, board_size, mandatory_capture)}
+    specs = {Piece.P1: p1_spec, Piece.P2: p2_spec}
+    for agent in agents.values():
+        agent.reset(rng.randrange(2**32))
+
+    game = Game(None, _get_logger(log_file), board_size, mandatory_capture)
+    # random opening moves so deterministic agents do not replay the same game
+    opener = Minimax(depth=0)
+    while game.moves < opening_plies and game.winner() is None:
+        game.AI_move(rng.choice(opener.get_all_outcomes(game.get_board(), game.current_player)))
+
+    times = {Piece.P1: 0.0, Piece.P2: 0.0}
+    counts = {Piece.P1: 0, Piece.P2: 0}
+    while game.winner() is None and game.moves < max_moves:
+        player = game.current_player
+        start = time.perf_counter()
+        new_board = agents[player].act(game.get_board(), player)
+        times[player] += time.perf_counter() - start
+        counts[player] += 1
+        game.AI_move(new_board)
+
+    winner = game.winner()
+    if winner is None:
+        # adjudicated as a draw
+        game.end_log(Color.WHITE)
+    score = 1.0 if winner == Piece.P1 else 0.0 if winner == Piece.P2 else 0.5
+    return {
+        "p1": p1_spec,
+        "p2": p2_spec,
+        "p1_score": score,
+        "moves": game.moves,
+        "time": {specs[p]: times[p] for p in specs},
+        "count": {specs[p]: counts[p] for p in specs},
+    }
+
+def _play_match(args: tuple) -> dict:
+    return play_match(*args)
+
+def schedule(specs: list[str], games: int, seed: int=0, max_moves: int=200, opening_plies: int=2, log_file: str | None=None,
+             board_size: int=Win_Config.NO_OF_ROWS, mandatory_capture: bool=False) -> list[tuple]:
+    """Round robin schedule, each pair plays `games` games with alternating colors."""
+    matches = []
+    for i, a in enumerate(specs):
+        for b in specs[i + 1:]:
+            for g in range(games):
+                # both colors of a pairing share an opening
+                match_seed = seed * 1_000_003 + len(matches) - g % 2
+                p1, p2 = (a, b) if g % 2 == 0 else (b, a)
+                matches.append((p1, p2, match_seed, max_moves, opening_plies, log_file, board_size, mandatory_capture))
+    return matches
+
+def bradley_terry_elo(results: list[tuple[str, str, float]], names: list[str], iterations: int=200) -> dict[str, float]:
+    """Maximum likelihood Elo ratings (mean 1500), draws count as half a win."""
+    wins = defaultdict(float)
+    played = defaultdict(float)
+    for a, b, score in results:
+        wins[a] += score
+        wins[b] += 1 - score
+        played[(a, b)] += 1
+        played[(b, a)] += 1
+    # one virtual draw per pairing keeps the estimate finite for unbeaten/winless agents
+    for a, b in list(played):
+        wins[a] += 0.5
+        played[(a, b)] += 1
+
+    strength = {name: 1.0 for name in names}
+    for _ in range(iterations):
+        new_strength = {}
+        for name in names:
+            denom = sum(n / (strength[name] + strength[b]) for (a, b), n in played.items() if a == name)
+            new_strength[name] = wins[name] / denom if denom else strength[name]
+        mean_log = sum(math.log(s) for s in new_strength.values()) / len(names)
+        strength = {name: s / math.exp(mean_log) for name, s in new_strength.items()}
+    return {name: 1500 + 400 * math.log10(s) for name, s in strength.items()}
+
+def elo_intervals(results: list[tuple[str, str, float]], names: list[str], samples: int=200, seed: int=0) -> dict[str, tuple[float, float]]:
+    """95% bootstrap confidence intervals for the Elo ratings."""
+    rng = random.Random(seed)
+    draws = defaultdict(list)
+    for _ in range(samples):
+        resampled = [rng.choice(results) for _ in results]
+        for name, elo in bradley_terry_elo(resampled, names, iterations=50).items():
+            draws[name].append(elo)
+    intervals = {}
+    for name in names:
+        values = sorted(draws[name])
+        intervals[name] = (values[int(0.025 * (samples - 1))], values[int(0.975 * (samples - 1))])
+    return intervals
+
+def run_arena(specs: list[str], games: int=20, workers: int | None=None, seed: int=0, max_moves: int=200, opening_plies: int=2, log_file: str | None=None,
+              board_size: int=Win_Config.NO_OF_ROWS, mandatory_capture: bool=False) -> dict:
+    """Play a round robin between the agents on a process pool and summarize the results."""
+    matches = schedule(specs, games, seed, max_moves, opening_plies, log_file, board_size, mandatory_capture)
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        records = list(executor.map(_play_match, matches, chunksize=max(1, len(matches) // (workers * 4))))
+
+    stats = {name: {"win": 0, "draw": 0, "loss": 0, "time": 0.0, "count": 0} for name in specs}
+    results = []
+    for record in records:
+        results.append((record["p1"], record["p2"], record["p1_score"]))
+        for name, score in ((record["p1"], record["p1_score"]), (record["p2"], 1 - record["p1_score"])):
+            stats[name]["win" if score == 1 else "draw" if score == 0.5 else "loss"] += 1
+            stats[name]["time"] += record["time"][name]
+            stats[name]["count"] += record["count"][name]
+
+    elo = bradley_terry_elo(results, specs)
+    intervals = elo_intervals(results, specs, seed=seed)
+    for name in specs:
+        stats[name]["elo"] = elo[name]
+        stats[name]["elo_ci"] = intervals[name]
+        stats[name]["avg_move_ms"] = stats[name]["time"] / stats[name]["count"] * 1000 if stats[name]["count"] else 0.0
+    return stats
+
+def print_report(stats: dict) -> None:
+    """Print the arena results as a table sorted by Elo."""
+    print(f"{'Agent':<28}{'W':>6}{'D':>6}{'L':>6}{'Elo':>8}{'95% CI':>18}{'ms/move':>10}")
+    for name, s in sorted(stats.items(), key=lambda item: -item[1]["elo"]):
+        low, high = s["elo_ci"]
+        print(f"{name:<28}{s['win']:>6}{s['draw']:>6}{s['loss']:>6}{s['elo']:>8.0f}"
+              f"{f'[{low:.0f}, {high:.0f}]':>18}{s['avg_move_ms']:>10.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless agent-vs-agent tournament with Elo ratings.")
+    parser.add_argument("--agents", nargs="+", default=["minimax:2", "minimax:4", "qlearning", "random"],
+                        help="agent specs: minimax[:depth], qlearning[:q_table_file], random")
+    parser.add_argument("--games", type=int, default=20, help="games per pairing (colors alternate)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-moves", type=int, default=200, help="games longer than this are drawn")
+    parser.add_argument("--opening-plies", type=int, default=2, help="random moves played before the agents take over")
+    parser.add_argument("--board-size", type=int, choices=Board.SIZES, default=Win_Config.NO_OF_ROWS)
+    parser.add_argument("--mandatory-capture", action="store_true", help="captures must be taken and multi-jumps completed")
+    parser.add_argument("--log-file", default=None, help="append the game records to this log (for offline training)")
+    args = parser.parse_args()
+
+    if len(set(args.agents)) != len(args.agents):
+        parser.error("agent specs must be unique")
+    # build every agent once so a bad spec fails here and not inside a worker process
+    for spec in args.agents:
+        try:
+            make_agent(spec, args.board_size, args.mandatory_capture)
+        except ValueError as error:
+            parser.error(str(error))
+    stats = run_arena(args.agents, args.games, args.workers, args.seed, args.max_moves, args.opening_plies, args.log_file,
+                      args.board_size, args.mandatory_capture)
+    print_report(stats)
+
+if __name__ == '__main__':
+    main()
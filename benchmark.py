@@ -0,0 +1,56 @@
+import time
+import random
+import argparse
+from checkers_env.piece import Piece
+from checkers_env.board import Board
+from algorithm.minimax import Minimax
+
+def sample_positions(board_size: int, mandatory_capture: bool, count: int, seed: int=0) -> list[tuple[Board, object]]:
+    """Positions (with the player to move) from random playouts."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board, player = Board(board_size, mandatory_capture), Piece.P1
+        for _ in range(rng.randrange(4, 40)):
+            outcomes = Minimax(depth=0).get_all_outcomes(board, player)
+            if not outcomes or board.winner() is not None:
+                break
+            board = rng.choice(outcomes)
+            player = Piece.P2 if player == Piece.P1 else Piece.P1
+        if board.winner() is None:
+            positions.append((board, player))
+    return positions
+
+def bench_move_generation(positions: list[tuple[Board, object]], repeat: int=20) -> float:
+    """Microseconds to generate all actions of the player to move."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for board, player in positions:
+            board.get_all_actions(player)
+    return (time.perf_counter() - start) / (repeat * len(positions)) * 1e6
+
+def bench_minimax(positions: list[tuple[Board, object]], depth: int) -> float:
+    """Milliseconds per minimax move."""
+    start = time.perf_counter()
+    for board, player in positions:
+        Minimax(depth=depth, player=player).get_best_action(board)
+    return (time.perf_counter() - start) / len(positions) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark move generation and minimax on each board size.")
+    parser.add_argument("--sizes", type=int, nargs="+", choices=Board.SIZES, default=list(Board.SIZES))
+    parser.add_argument("--depths", type=int, nargs="+", default=[2, 4, 6])
+    parser.add_argument("--positions", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        for mandatory_capture in (False, True):
+            positions = sample_positions(size, mandatory_capture, args.positions, args.seed)
+            label = f"{size}x{size}{' mandatory capture' if mandatory_capture else ''}"
+            print(f"{label:<24} move generation: {bench_move_generation(positions):8.1f} us/position")
+            for depth in args.depths:
+                print(f"{label:<24} minimax depth {depth}: {bench_minimax(positions, depth):10.2f} ms/move")
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,6 @@
+import math
 import pygame
+from copy import copy
 from .win_config import Win_Config
 from .color import Color
 from .piece import Piece
@@ -6,11 +8,17 @@ from .piece import Piece
 class Board:
     """Class to represent the game board."""
     BOARD_SIZE = ROW = COL = Win_Config.NO_OF_ROWS
+    SIZES = (6, 8)
     BOX_COLOR_1 = Color.BEIGE
     BOX_COLOR_2 = Color.BROWN
 
-    def __init__(self) -> None:
-        self.p2_pawns = self.p1_pawns = 6
+    def __init__(self, size: int=Win_Config.NO_OF_ROWS, mandatory_capture: bool=False) -> None:
+        self.BOARD_SIZE = self.ROW = self.COL = size
+        self.square_size = Win_Config.WINDOW_SIZE // size
+        # when set, a capture must be taken if available and multi-jumps must be completed
+        self.mandatory_capture = mandatory_capture
+        # (size // 2 - 1) rows of size // 2 pieces each: 6 on 6x6, 12 on 8x8
+        self.p2_pawns = self.p1_pawns = (size // 2 - 1) * (size // 2)
         self.p2_kings = self.p1_kings = 0
         self.board = []
         self.create_board()
@@ -22,14 +30,21 @@ class Board:
             for col in range(self.COL):
                 if (row + col) % 2 == 1:
                     if row < self.BOARD_SIZE // 2 - 1:
-                        self.board[row].append(Piece(row, col, Piece.P1))
+                        self.board[row].append(Piece(row, col, Piece.P1, self.BOARD_SIZE))
                     elif row > self.BOARD_SIZE // 2:
-                        self.board[row].append(Piece(row, col, Piece.P2))
+                        self.board[row].append(Piece(row, col, Piece.P2, self.BOARD_SIZE))
                     else:
                         self.board[row].append(0)
                 else:
                     self.board[row].append(0)
 
+    def copy(self) -> 'Board':
+        """Return an independent copy of the board (much cheaper than deepcopy)."""
+        new_board = Board.__new__(Board)
+        new_board.__dict__.update(self.__dict__)
+        new_board.board = [[piece if piece == 0 else copy(piece) for piece in row] for row in self.board]
+        return new_board
+
     def move_piece(self, piece: Piece, row: int, col: int) -> None:
         """Move a piece to a new position and handle promotion."""
         self.board[piece.row][piece.col], self.board[row][col] = 0, piece
@@ -39,8 +54,10 @@ class Board:
         if was_king != is_king:
             if piece.player == Piece.P1:
                 self.p1_kings += 1
+                self.p1_pawns -= 1
             else:
                 self.p2_kings += 1
+                self.p2_pawns -= 1
 
     def remove_pieces(self, pieces: list[Piece]) -> None:
         """Remove pieces from the board."""
@@ -57,104 +74,75 @@ class Board:
                 else:
                     self.p2_pawns -= 1
 
+    def _directions(self, piece: Piece) -> tuple[tuple[int, int], ...]:
+        """Diagonal directions a piece can move in (P1 moves down, P2 moves up, kings both)."""
+        if piece.is_king:
+            return ((1, -1), (1, 1), (-1, -1), (-1, 1))
+        if piece.player == Piece.P1:
+            return ((1, -1), (1, 1))
+        return ((-1, -1), (-1, 1))
+
     def get_actions(self, piece: Piece) -> dict[tuple[int, int], list[Piece]]:
-        """Returns all valid actions for a given piece."""
-        actions = {}
-        row = piece.row
-        left = piece.col - 1
-        right = piece.col + 1
-        
-        # For P1 and Kings, traverse down-right and down-left
-        if piece.player == Piece.P1 or piece.is_king:
-            actions.update(self._traverse_left(row + 1, min(row + 3, self.ROW), 1, piece.player, left))
-            actions.update(self._traverse_right(row + 1, min(row + 3, self.ROW), 1, piece.player, right))
-        
-        # For P2 and Kings, traverse up-right and up-left
-        if piece.player == Piece.P2 or piece.is_king:
-            actions.update(self._traverse_left(row - 1, max(row - 3, -1), -1, piece.player, left))
-            actions.update(self._traverse_right(row - 1, max(row - 3, -1), -1, piece.player, right))
-        
-        return actions
+        """Returns all valid actions for a given piece (target square -> captured pieces)."""
+        jumps = {}
+        self._find_jumps(piece, piece.row, piece.col, self._directions(piece), [], jumps)
+        if self.mandatory_capture and jumps:
+            return jumps
 
-    def _traverse_left(self, start, stop, step, color, left, skipped=[]):
-        """Traverse to the left (diagonal) to check for valid actions."""
         actions = {}
-        last = []
-        
-        # Traverse in the specified direction (up or down) until the stop condition
-        for r in range(start, stop, step):
-            if left < 0:
-                break
-
-            current = self.board[r][left]
-            
-            if current == 0:
-                # If the square is empty, check if we can make a regular move or a jump
-                if skipped and not last:
-                    break
-                elif skipped:
-                    # If we have a skipped piece, record this as a valid jump
-                    actions[(r, left)] = last + skipped
-                else:
-                    # Regular move to an empty space
-                    actions[(r, left)] = last
-                
-                if last:
-                    # After a jump, we recursively check the further diagonals
-                    row = r + step
-                    actions.update(self._traverse_left(row, max(row - 3, -1), step, color, left - 1, skipped=last))
-                    actions.update(self._traverse_right(row, max(row - 3, -1), step, color, left + 1, skipped=last))
-                break
-            elif current.player == color:
-                # If the piece belongs to the same player, stop traversing
-                break
-            else:
-                # Otherwise, it's an opponent's piece, and we can "skip" over it for a jump
-                last = [current]
-
-            left -= 1
-        
+        for d_row, d_col in self._directions(piece):
+            row, col = piece.row + d_row, piece.col + d_col
+            if 0 <= row < self.ROW and 0 <= col < self.COL and self.board[row][col] == 0:
+                actions[(row, col)] = []
+        actions.update(jumps)
         return actions
 
-    def _traverse_right(self, start, stop, step, color, right, skipped=[]):
-        """Traverse to the right (diagonal) to check for valid actions."""
-        actions = {}
-        last = []
-        
-        # Traverse in the specified direction (up or down) until the stop condition
-        for r in range(start, stop, step):
-            if right >= self.COL:
-                break
-
-            current = self.board[r][right]
-            
+    def _find_jumps(self, piece: Piece, row: int, col: int, directions: tuple, captured: list[Piece], jumps: dict) -> bool:
+        """Depth first search of the (multi-)jumps of a piece from (row, col), returns whether any was found."""
+        found = False
+        for d_row, d_col in directions:
+            land_row, land_col = row + 2 * d_row, col + 2 * d_col
+            if not (0 <= land_row < self.ROW and 0 <= land_col < self.COL):
+                continue
+            over = self.board[row + d_row][col + d_col]
+            land = self.board[land_row][land_col]
+            if over == 0 or over.player == piece.player or over in captured or (land != 0 and land is not piece):
+                continue
+            found = True
+            chain = captured + [over]
+            # a pawn that reaches the last row is crowned and its move ends
+            crowned = not piece.is_king and land_row in (0, self.ROW - 1)
+            continued = not crowned and self._find_jumps(piece, land_row, land_col, directions, chain, jumps)
+            # without mandatory capture a multi-jump may also stop half way
+            if not self.mandatory_capture or not continued:
+                jumps.setdefault((land_row, land_col), chain)
+        return found
+
+    def get_all_actions(self, color: Color) -> dict[Piece, dict[tuple[int, int], list[Piece]]]:
+        """Returns the valid actions of every piece of a player that can move."""
+        all_actions = {}
+        for piece in self.get_all_pieces(color):
+            actions = self.get_actions(piece)
+            if actions:
+                all_actions[piece] = actions
+        if self.mandatory_capture and any(skip for actions in all_actions.values() for skip in actions.values()):
+            # only the pieces that can capture may move
+            all_actions = {piece: actions for piece, actions in all_actions.items() if any(actions.values())}
+        return all_actions
+
+    def _can_move(self, piece: Piece) -> bool:
+        """Whether a piece has at least one valid action (without generating all of them)."""
+        for d_row, d_col in self._directions(piece):
+            row, col = piece.row + d_row, piece.col + d_col
+            if not (0 <= row < self.ROW and 0 <= col < self.COL):
+                continue
+            current = self.board[row][col]
             if current == 0:
-                # If the square is empty, check if we can make a regular move or a jump
-                if skipped and not last:
-                    break
-                elif skipped:
-                    # If we have a skipped piece, record this as a valid jump
-                    actions[(r, right)] = last + skipped
-                else:
-                    # Regular move to an empty space
-                    actions[(r, right)] = last
-                
-                if last:
-                    # After a jump, we recursively check the further diagonals
-                    row = r + step
-                    actions.update(self._traverse_left(row, min(row + 3, self.ROW), step, color, right - 1, skipped=last))
-                    actions.update(self._traverse_right(row, min(row + 3, self.ROW), step, color, right + 1, skipped=last))
-                break
-            elif current.player == color:
-                # If the piece belongs to the same player, stop traversing
-                break
-            else:
-                # Otherwise, it's an opponent's piece, and we can "skip" over it for a jump
-                last = [current]
-
-            right += 1
-        
-        return actions
+                return True
+            land_row, land_col = row + d_row, col + d_col
+            if current.player != piece.player and 0 <= land_row < self.ROW and 0 <= land_col < self.COL and self.board[land_row][land_col] == 0:
+                return True
+        return False
 
     def get_all_pieces(self, color: Color) -> list[Piece]:
         """Get all the pieces of a given color."""
@@ -173,8 +161,8 @@ class Board:
             return Piece.P2
         p1_pieces = self.get_all_pieces(Piece.P1)
         p2_pieces = self.get_all_pieces(Piece.P2)
-        p1_actions = any(self.get_actions(piece) for piece in p1_pieces)
-        p2_actions = any(self.get_actions(piece) for piece in p2_pieces)
+        p1_actions = any(self._can_move(piece) for piece in p1_pieces)
+        p2_actions = any(self._can_move(piece) for piece in p2_pieces)
         if not p1_actions and not p2_actions:
             return Color.WHITE if self.evaluate() == 0 else (Piece.P2 if self.evaluate() < 0 else Piece.P1)
         if not p1_actions:
@@ -184,23 +172,62 @@ class Board:
         return None
 
     def evaluate(self) -> float:
-        """Evaluate the board state for the AI."""
+        """Evaluate the board state for the AI (player 1 is positive)."""
         if self.p1_pawns + self.p1_kings == 0:
-            return 100
-        if self.p2_pawns + self.p2_kings == 0:
             return -100
+        if self.p2_pawns + self.p2_kings == 0:
+            return 100
         return (self.p1_pawns - self.p2_pawns) + ((self.p1_kings - self.p2_kings) * 1.5)
 
     def get_piece(self, row: int, col: int) -> Piece | int:
         """Get the piece at a given position or return 0 if empty."""
         return self.board[row][col]
 
+    def flip(self) -> 'Board':
+        """Return a copy rotated by 180 degrees with the players swapped (P2 seen as P1)."""
+        return Board.decode(Board.flip_key(self.encode()), self.mandatory_capture)
+
+    @staticmethod
+    def flip_key(state: str) -> str:
+        """Flip an encoded board state (see flip)."""
+        return state[::-1].translate(str.maketrans("bBrR", "rRbB"))
+
+    @classmethod
+    def decode(cls, state: str, mandatory_capture: bool=False) -> 'Board':
+        """Build a board from a state encoded with encode(), the size follows from its length."""
+        size = math.isqrt(len(state))
+        board = cls.__new__(cls)
+        board.BOARD_SIZE = board.ROW = board.COL = size
+        board.square_size = Win_Config.WINDOW_SIZE // size
+        board.mandatory_capture = mandatory_capture
+        board.p2_pawns = board.p1_pawns = 0
+        board.p2_kings = board.p1_kings = 0
+        board.board = []
+        for row in range(size):
+            board.board.append([])
+            for col in range(size):
+                char = state[row * size + col]
+                if char == "0":
+                    board.board[row].append(0)
+                    continue
+                piece = Piece(row, col, Piece.P1 if char in "bB" else Piece.P2, size)
+                if char.isupper():
+                    piece.promote_to_king()
+                if piece.player == Piece.P1:
+                    board.p1_kings += piece.is_king
+                    board.p1_pawns += not piece.is_king
+                else:
+                    board.p2_kings += piece.is_king
+                    board.p2_pawns += not piece.is_king
+                board.board[row].append(piece)
+        return board
+
     def draw(self, window: pygame.Surface) -> None:
         """Draw the board on the window."""
         window.fill(self.BOX_COLOR_1)
         for row in range(self.ROW):
             for col in range(row % 2, self.COL, 2):
-                pygame.draw.rect(window, self.BOX_COLOR_2, (row * Win_Config.SQUARE_SIZE, col * Win_Config.SQUARE_SIZE, Win_Config.SQUARE_SIZE, Win_Config.SQUARE_SIZE))
+                pygame.draw.rect(window, self.BOX_COLOR_2, (row * self.square_size, col * self.square_size, self.square_size, self.square_size))
         for row in self.board:
             for piece in row:
                 if piece != 0:
@@ -1,21 +1,32 @@
+import time
 import pygame
 from .win_config import Win_Config
 from .color import Color
 from .piece import Piece
 from .board import Board
+from .game_log import Game_Logger
 
 class Game:
-    def __init__(self, window: pygame.Surface) -> None:
-        self.board = Board()
+    def __init__(self, window: pygame.Surface, logger: Game_Logger | None=None, board_size: int=Win_Config.NO_OF_ROWS, mandatory_capture: bool=False) -> None:
+        self.board = Board(board_size, mandatory_capture)
         # Player 1 starts the game
         self.current_player = Piece.P1
         self.selected_piece = None
         self.valid_actions = {}
         self.window = window
         self.moves = 0
+        # optional streaming game record
+        self.logger = logger
+        if logger:
+            self.game_id = logger.start_game()
+            self.logged_state = self.board.encode()
+            self.turn_start = time.perf_counter()
+            self.log_ended = False
     
     def change_player(self) -> None:
         """Change the turn of the game."""
+        if self.logger:
+            self._log_move()
         self.moves += 1
         self.selected_piece = None
         self.valid_actions = {}
@@ -24,13 +35,29 @@ class Game:
         else:
             self.current_player = Piece.P1
 
+    def _log_move(self) -> None:
+        """Log the move that was just played and the end of the game if it is over."""
+        state = self.board.encode()
+        now = time.perf_counter()
+        self.logger.log_move(self.game_id, self.current_player, self.logged_state, state, now - self.turn_start)
+        self.logged_state, self.turn_start = state, now
+        winner = self.board.winner()
+        if winner is not None:
+            self.end_log(winner, self.moves + 1)
+
+    def end_log(self, winner: Color | None=None, moves: int | None=None) -> None:
+        """Write the end of the game record (a None winner marks an abandoned game)."""
+        if self.logger and not self.log_ended:
+            self.logger.end_game(self.game_id, self.board.encode(), winner, self.moves if moves is None else moves)
+            self.log_ended = True
+
     def select_pos(self, row: int, col: int) -> None:
         """Select a piece on the board."""
         if not self.selected_piece:
             piece = self.board.get_piece(row, col)
             if piece != 0 and piece.player == self.current_player:
                 self.selected_piece = piece
-                self.valid_actions = self.board.get_actions(piece)
+                self.valid_actions = self.board.get_all_actions(self.current_player).get(piece, {})
         else:
             result = self._move(row, col)
             if not result:
@@ -41,7 +68,8 @@ class Game:
     def _move(self, row: int, col: int) -> bool:
         """Move a piece on the board."""
         piece = self.board.get_piece(row, col)
-        if piece == 0 and (row, col) in self.valid_actions:
+        # a king's closed-loop multi-jump ends on its own square
+        if (piece == 0 or piece is self.selected_piece) and (row, col) in self.valid_actions:
             self.board.move_piece(self.selected_piece, row, col)
             skipped = self.valid_actions[(row, col)]
             if skipped:
@@ -73,15 +101,16 @@ class Game:
     def mouse_pos_to_board_pos(self, pos: tuple[int, int]) -> tuple[int, int]:
         """Get the row and column of the clicked square."""
         x, y = pos
-        col = x // Win_Config.SQUARE_SIZE
-        row = y // Win_Config.SQUARE_SIZE
+        col = x // self.board.square_size
+        row = y // self.board.square_size
         return (row, col)
 
     def draw_valid_actions(self, actions: dict[tuple[int, int], list[Piece]], window: pygame.Surface) -> None:
         """Draw valid actions on the board."""
+        square_size = self.board.square_size
         for action in actions:
             row, col = action
-            pygame.draw.circle(window, Color.DARK_ORANGE, (col * Win_Config.SQUARE_SIZE + Win_Config.SQUARE_SIZE // 2, row * Win_Config.SQUARE_SIZE + Win_Config.SQUARE_SIZE // 2), 15)
+            pygame.draw.circle(window, Color.DARK_ORANGE, (col * square_size + square_size // 2, row * square_size + square_size // 2), 15)
 
     def __str__(self) -> str:
         return str(self.board) + f"\nPlayer: {'P1' if self.current_player == Piece.P1 else 'P2'}\nMoves: {self.moves}\nWinner: {'P1' if self.winner() == Piece.P1 else 'P2' if self.winner() == Piece.P2 else 'None'}"
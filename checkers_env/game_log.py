@@ -0,0 +1,114 @@
+import gzip
+import math
+import uuid
+from typing import Iterator, NamedTuple
+from .color import Color
+from .piece import Piece
+from .board import Board
+
+class Move_Record(NamedTuple):
+    """One move of a logged game."""
+    player: int  # 1 or 2
+    state: str  # Board.encode() before the move
+    action: str  # "row,col,target_row,target_col"
+    captures: list[tuple[int, int]]
+    elapsed: float  # seconds spent on the move
+
+class Game_Record(NamedTuple):
+    """A complete logged game."""
+    game_id: str
+    moves: list[Move_Record]
+    final_state: str
+    winner: str  # "1", "2", "0" for a draw or "-" if the game was abandoned
+
+class Game_Logger:
+    """Streaming, append-only game-record log (one tab separated line per move).
+
+    M <game_id> <player> <state> <action> <captures> <elapsed_ms>
+    E <game_id> <final_state> <winner> <moves>
+    """
+    LOG_FILE = "game_log.tsv"
+    PLAYERS = {Piece.P1: "1", Piece.P2: "2"}
+    PIECES = {"1": "bB", "2": "rR"}
+
+    def __init__(self, log_file: str=LOG_FILE) -> None:
+        self.log_file = log_file
+        # line buffered so every record is a single append, even with several writer processes
+        self.file = open(log_file, mode='a', buffering=1)
+
+    def start_game(self) -> str:
+        """Return a new unique game id."""
+        return uuid.uuid4().hex[:12]
+
+    def log_move(self, game_id: str, player: Color, state_before: str, state_after: str, elapsed: float) -> None:
+        """Append a move, the action and captures are recovered from the two states."""
+        player = self.PLAYERS[player]
+        action, captures = self.diff(state_before, state_after, player)
+        captures = ";".join(f"{row},{col}" for row, col in captures)
+        self.file.write(f"M\t{game_id}\t{player}\t{state_before}\t{action}\t{captures}\t{elapsed * 1000:.3f}\n")
+
+    def end_game(self, game_id: str, final_state: str, winner: Color | None, moves: int) -> None:
+        """Append the end of game record."""
+        winner = self.PLAYERS.get(winner, "0" if winner == Color.WHITE else "-")
+        self.file.write(f"E\t{game_id}\t{final_state}\t{winner}\t{moves}\n")
+
+    def close(self) -> None:
+        """Close the log file."""
+        self.file.close()
+
+    @classmethod
+    def diff(cls, state_before: str, state_after: str, player: str) -> tuple[str, list[tuple[int, int]]]:
+        """Recover the action and captured squares of `player` from two encoded states."""
+        size = math.isqrt(len(state_before))
+        own = cls.PIECES[player]
+        source = target = None
+        captures = []
+        for i, (before, after) in enumerate(zip(state_before, state_after)):
+            if before == after or (before in own and after in own):
+                continue
+            if before in own:
+                source = divmod(i, size)
+            elif after in own:
+                target = divmod(i, size)
+            elif after == "0":
+                captures.append(divmod(i, size))
+        if source is None and target is None and captures:
+            # a king's closed-loop multi-jump ends on its starting square
+            source = target = cls._loop_jump_square(state_before, player, captures)
+        if source is None or target is None:
+            return "", captures
+        return f"{source[0]},{source[1]},{target[0]},{target[1]}", captures
+
+    @staticmethod
+    def _loop_jump_square(state_before: str, player: str, captures: list[tuple[int, int]]) -> tuple[int, int] | None:
+        """Find the king whose multi-jump back to its own square captures exactly `captures`."""
+        board = Board.decode(state_before)
+        for piece in board.get_all_pieces(Piece.P1 if player == "1" else Piece.P2):
+            skipped = board.get_actions(piece).get((piece.row, piece.col))
+            if skipped and sorted((p.row, p.col) for p in skipped) == sorted(captures):
+                return (piece.row, piece.col)
+        return None
+
+def _open(log_file: str):
+    if log_file.endswith(".gz"):
+        return gzip.open(log_file, mode='rt')
+    return open(log_file, mode='r')
+
+def read_games(log_file: str) -> Iterator[Game_Record]:
+    """Lazily yield complete games from a log (plain or .gz).
+
+    Only the games that are still in progress at a given line are kept in memory,
+    so interleaved logs written by several processes are replayed correctly.
+    """
+    open_games = {}
+    with _open(log_file) as file:
+        for line in file:
+            fields = line.rstrip("\n").split("\t")
+            if fields[0] == "M":
+                open_games.setdefault(fields[1], []).append(_parse_move(fields))
+            elif fields[0] == "E":
+                yield Game_Record(fields[1], open_games.pop(fields[1], []), fields[2], fields[3])
+
+def _parse_move(fields: list[str]) -> Move_Record:
+    captures = [tuple(map(int, square.split(","))) for square in fields[5].split(";") if square]
+    return Move_Record(int(fields[2]), fields[3], fields[4], captures, float(fields[6]) / 1000)
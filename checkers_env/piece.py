@@ -6,31 +6,32 @@ class Piece:
     """Class to represent a piece on the board."""
     PADDING = 30
     BORDER = 15
-    RADIUS = (Win_Config.SQUARE_SIZE // 2) - PADDING
     P1 = Color.LIGHT_BLUE
     P2 = Color.LIGHT_RED
     PAWN_BORDER = Color.DARK_GREEN
     KING_BORDER = Color.DARK_RED
 
-    def __init__(self, row: int, col: int, player: Color) -> None:
+    def __init__(self, row: int, col: int, player: Color, board_size: int=Win_Config.NO_OF_ROWS) -> None:
         self.row = row
         self.col = col
         self.player = player
+        self.board_size = board_size
         self.border_color = self.PAWN_BORDER
         self.is_king = False
         self.x, self.y = self.calculate_position()
 
     def calculate_position(self) -> tuple[int, int]:
         """Calculate the pixel coordinates for the piece."""
-        x = (Win_Config.SQUARE_SIZE * self.col) + (Win_Config.SQUARE_SIZE // 2)
-        y = (Win_Config.SQUARE_SIZE * self.row) + (Win_Config.SQUARE_SIZE // 2)
+        square_size = Win_Config.WINDOW_SIZE // self.board_size
+        x = (square_size * self.col) + (square_size // 2)
+        y = (square_size * self.row) + (square_size // 2)
         return (x, y)
 
     def move(self, row: int, col: int) -> None:
         """Move the piece to a new position and promote it if necessary."""
         self.row, self.col = row, col
         self.x, self.y = self.calculate_position()
-        if row == 0 or row == Win_Config.NO_OF_ROWS - 1:
+        if row == 0 or row == self.board_size - 1:
             self.promote_to_king()
 
     def promote_to_king(self) -> None:
@@ -41,8 +42,9 @@ class Piece:
 
     def draw(self, window: pygame.Surface) -> None:
         """Draw the piece on the board."""
-        pygame.draw.circle(window, self.border_color, (self.x, self.y), Piece.RADIUS + Piece.BORDER)
-        pygame.draw.circle(window, self.player, (self.x, self.y), Piece.RADIUS)
+        radius = (Win_Config.WINDOW_SIZE // self.board_size // 2) - Piece.PADDING
+        pygame.draw.circle(window, self.border_color, (self.x, self.y), radius + Piece.BORDER)
+        pygame.draw.circle(window, self.player, (self.x, self.y), radius)
 
     def __str__(self) -> str:
         if self.player == self.P1:
@@ -3,4 +3,3 @@ class Win_Config:
     FPS = 10
     WINDOW_SIZE = 800
     NO_OF_ROWS = 6
-    SQUARE_SIZE = WINDOW_SIZE // NO_OF_ROWS
@@ -1,15 +1,19 @@
+import argparse
 import pygame
 from checkers_env.win_config import Win_Config
 from checkers_env.piece import Piece
+from checkers_env.board import Board
 from checkers_env.game import Game
+from checkers_env.game_log import Game_Logger
 from algorithm.minimax import Minimax
 
-def main():
+def main(board_size=Win_Config.NO_OF_ROWS, mandatory_capture=False):
     window = pygame.display.set_mode((Win_Config.WINDOW_SIZE, Win_Config.WINDOW_SIZE))
     pygame.display.set_caption('Checkers Game - Play against Minimax Algorithm')
     clock = pygame.time.Clock()
     
-    game = Game(window)
+    logger = Game_Logger()
+    game = Game(window, logger, board_size, mandatory_capture)
     minimax = Minimax()
     
     run = True
@@ -29,7 +33,13 @@ def main():
             
         game.update()
     
+    game.end_log()
+    logger.close()
     pygame.quit()
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--board-size", type=int, choices=Board.SIZES, default=Win_Config.NO_OF_ROWS)
+    parser.add_argument("--mandatory-capture", action="store_true", help="captures must be taken and multi-jumps completed")
+    args = parser.parse_args()
+    main(args.board_size, args.mandatory_capture)
@@ -1,17 +1,21 @@
+import argparse
 import pygame
 from checkers_env.win_config import Win_Config
 from checkers_env.piece import Piece
+from checkers_env.board import Board
 from checkers_env.game import Game
-from algorithm.q_learning import Q_Learning
+from checkers_env.game_log import Game_Logger
+from algorithm.compiled_policy import Compiled_Policy
 
-def main():
+def main(board_size=Win_Config.NO_OF_ROWS, mandatory_capture=False):
     window = pygame.display.set_mode((Win_Config.WINDOW_SIZE, Win_Config.WINDOW_SIZE))
     pygame.display.set_caption('Checkers Game - Play against QLearning Algorithm')
     clock = pygame.time.Clock()
     
-    game = Game(window)
-    # Load pre-trained Q-learning model (epsilon=0 for pure exploitation, no exploration)
-    q_learning = Q_Learning(epsilon=0.0)
+    logger = Game_Logger()
+    game = Game(window, logger, board_size, mandatory_capture)
+    # Load the pre-trained Q-learning model compiled to a greedy policy (epsilon=0, no exploration)
+    policy = Compiled_Policy.load_or_compile(board_size=board_size, mandatory_capture=mandatory_capture)
 
     run = True
     while run and game.winner() is None:
@@ -19,7 +23,7 @@ def main():
 
         if game.current_player == Piece.P1:
             # Get best action from trained Q-learning agent
-            new_board, _ = q_learning.get_best_action(game.board, is_training=False)
+            new_board, _ = policy.play(game.board)
             game.AI_move(new_board)
 
         for event in pygame.event.get():
@@ -32,7 +36,13 @@ def main():
             
         game.update()
     
+    game.end_log()
+    logger.close()
     pygame.quit()
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--board-size", type=int, choices=Board.SIZES, default=Win_Config.NO_OF_ROWS)
+    parser.add_argument("--mandatory-capture", action="store_true", help="captures must be taken and multi-jumps completed")
+    args = parser.parse_args()
+    main(args.board_size, args.mandatory_capture)
@@ -11,10 +11,17 @@ export PYGAME_HIDE_SUPPORT_PROMPT="hide"
 
 echo -e "Choose one agent to play:\n1. Minimax agent\n2. Q-learning agent"
 read -p "> " choice
+echo -e "Choose the board size:\n1. 6x6\n2. 8x8 (standard, mandatory captures)"
+read -p "> " size
+if [ "$size" = "2" ]; then
+    options="--board-size 8 --mandatory-capture"
+else
+    options="--board-size 6"
+fi
 if [ "$choice" -eq 1 ]; then
-    python3 play_against_minimax.py
+    python3 play_against_minimax.py $options
 elif [ "$choice" -eq 2 ]; then
-    python3 play_against_qlearning.py
+    python3 play_against_qlearning.py $options
 else
     echo "Invalid choice."
 fi
@@ -0,0 +1,223 @@
+import json
+import time
+import socket
+import asyncio
+import argparse
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from checkers_env.win_config import Win_Config
+from checkers_env.piece import Piece
+from checkers_env.board import Board
+from checkers_env.game_log import Game_Logger
+from arena import make_agent, get_agent
+
+def _search(spec: str, state: str, player: int, mandatory_capture: bool) -> str:
+    """Worker process entry point, returns the state after the engine's move."""
+    board = Board.decode(state, mandatory_capture)
+    return get_agent(spec, board.BOARD_SIZE, mandatory_capture).act(board, Piece.P1 if player == 1 else Piece.P2).encode()
+
+class Move_Server:
+    """Long running move server: newline delimited JSON over a Unix or TCP socket.
+
+    Request:  {"state": Board.encode(), "player": 1 | 2, "engine": "minimax:4" | "qlearning", "mandatory_capture": false, "timeout": 2.0}
+    Response: {"action": "row,col,target_row,target_col", "captures": [[row, col]], "state": ..., "cached": bool, "ms": ...}
+    {"cmd": "metrics"} returns the server metrics, failures are answered with {"error": ...}.
+    """
+    MAX_DEPTH = 8
+    PIECES = set("0bBrR")
+
+    def __init__(self, workers: int | None=None, cache_size: int=100_000, timeout: float=5.0, q_table_files: dict[int, str] | None=None) -> None:
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.timeout = timeout
+        # the compiled Q-learning policies are loaded once and served in process (lookups are cheap)
+        # q_table_files overrides the size-tagged Q-table per board size (e.g. a model from a sweep)
+        q_table_files = q_table_files or {}
+        self.q_agents = {}
+        for size in Board.SIZES:
+            spec = f"qlearning:{q_table_files[size]}" if size in q_table_files else "qlearning"
+            for mandatory_capture in (False, True):
+                self.q_agents[(size, mandatory_capture)] = make_agent(spec, size, mandatory_capture)
+        # move cache shared by every connection: (engine, player, mandatory_capture, state) -> new state
+        # (each engine worker also keeps its own bounded minimax transposition table across requests)
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.in_flight = {}
+        self.started = time.perf_counter()
+        self.metrics = {"requests": 0, "cache_hits": 0, "errors": 0, "timeouts": 0}
+        self.latencies = deque(maxlen=10_000)
+
+    def _validate(self, request: dict) -> tuple[str, str, int]:
+        state = request.get("state")
+        player = request.get("player", 2)
+        engine = request.get("engine", "minimax:4")
+        if not isinstance(state, str) or len(state) not in (size * size for size in Board.SIZES) or not set(state) <= self.PIECES:
+            raise ValueError("invalid state")
+        # True == 1, so booleans (and floats) are rejected by type
+        if type(player) is not int or player not in (1, 2):
+            raise ValueError("player must be 1 or 2")
+        if not isinstance(engine, str):
+            raise ValueError(f"unknown engine: {engine}")
+        kind, _, depth = engine.partition(":")
+        if kind == "qlearning" and not depth:
+            return engine, state, player
+        if kind == "minimax" and (not depth or depth.isdecimal() and 1 <= int(depth) <= self.MAX_DEPTH):
+            # one canonical name per depth ("minimax:04" is "minimax:4") for the move cache and the worker agents
+            return f"minimax:{int(depth) if depth else 4}", state, player
+        raise ValueError(f"unknown engine: {engine}")
+
+    def _store(self, key: tuple, new_state: str) -> None:
+        self.cache[key] = new_state
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    async def best_move(self, request: dict) -> dict:
+        """Answer a single move request."""
+        engine, state, player = self._validate(request)
+        mandatory_capture = bool(request.get("mandatory_capture", False))
+        board = Board.decode(state, mandatory_capture)
+        color = Piece.P1 if player == 1 else Piece.P2
+        if not board.get_all_actions(color):
+            raise ValueError("no legal moves")
+
+        key = (engine, player, mandatory_capture, state)
+        cached = key in self.cache
+        if cached:
+            self.metrics["cache_hits"] += 1
+            self.cache.move_to_end(key)
+            new_state = self.cache[key]
+        elif engine == "qlearning":
+            new_state = self.q_agents[(board.BOARD_SIZE, mandatory_capture)].act(board, color).encode()
+            self._store(key, new_state)
+        else:
+            executor = self.executor
+            try:
+                # identical searches that are already running are shared, not repeated
+                if key not in self.in_flight:
+                    future = asyncio.get_running_loop().run_in_executor(executor, _search, engine, state, player, mandatory_capture)
+                    future.add_done_callback(lambda f: self._search_done(key, f))
+                    self.in_flight[key] = future
+                new_state = await asyncio.wait_for(asyncio.shield(self.in_flight[key]), request.get("timeout", self.timeout))
+            except asyncio.TimeoutError:
+                self.metrics["timeouts"] += 1
+                raise
+            except BrokenProcessPool:
+                self._restart_executor(executor)
+                raise
+        action, captures = Game_Logger.diff(state, new_state, str(player))
+        return {"action": action, "captures": captures, "state": new_state, "cached": cached}
+
+    def _restart_executor(self, broken: ProcessPoolExecutor) -> None:
+        """Replace a pool whose worker died (only once when several requests notice it)."""
+        if broken is self.executor:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def _search_done(self, key: tuple, future: asyncio.Future) -> None:
+        # searches that outlive their request timeout still warm the cache
+        self.in_flight.pop(key, None)
+        if not future.cancelled() and future.exception() is None:
+            self._store(key, future.result())
+
+    def report(self) -> dict:
+        """Latency and throughput metrics."""
+        uptime = time.perf_counter() - self.started
+        latencies = sorted(self.latencies)
+        percentile = lambda p: latencies[int(p * (len(latencies) - 1))] if latencies else 0.0
+        return {
+            **self.metrics,
+            "uptime_s": round(uptime, 3),
+            "requests_per_s": round(self.metrics["requests"] / uptime, 3) if uptime else 0.0,
+            "cache_entries": len(self.cache),
+            "in_flight": len(self.in_flight),
+            "latency_ms": {"p50": percentile(0.5), "p90": percentile(0.9), "p99": percentile(0.99), "max": percentile(1.0)},
+        }
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one connection, requests are answered in order."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # over the stream limit, the line is discarded
+                    line = None
+                if line == b"":
+                    break
+                start = time.perf_counter()
+                try:
+                    if line is None:
+                        raise ValueError("request too long")
+                    request = json.loads(line)
+                    if request.get("cmd") == "metrics":
+                        response = self.report()
+                    else:
+                        self.metrics["requests"] += 1
+                        response = await self.best_move(request)
+                except asyncio.TimeoutError:
+                    response = {"error": "timeout"}
+                except Exception as error:
+                    # bad requests, requests over the stream limit and engine failures are all answered
+                    self.metrics["errors"] += 1
+                    response = {"error": str(error) or type(error).__name__}
+                elapsed = (time.perf_counter() - start) * 1000
+                if "state" in response:
+                    self.latencies.append(round(elapsed, 3))
+                    response["ms"] = round(elapsed, 3)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, unix: str | None=None, host: str="127.0.0.1", port: int=8765) -> None:
+        """Serve forever on a Unix socket if given, otherwise on TCP."""
+        if unix:
+            server = await asyncio.start_unix_server(self.handle, path=unix)
+        else:
+            server = await asyncio.start_server(self.handle, host=host, port=port)
+        async with server:
+            await server.serve_forever()
+
+def request_move(state: str, player: int=2, engine: str="minimax:4", mandatory_capture: bool=False, unix: str | None=None, host: str="127.0.0.1", port: int=8765) -> dict:
+    """Ask a running server for a move (one connection per call)."""
+    family, address = (socket.AF_UNIX, unix) if unix else (socket.AF_INET, (host, port))
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.connect(address)
+        sock.sendall(json.dumps({"state": state, "player": player, "engine": engine, "mandatory_capture": mandatory_capture}).encode() + b"\n")
+        return json.loads(sock.makefile().readline())
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve best moves for encoded boards from one warm process.")
+    parser.add_argument("--unix", default=None, help="Unix socket path (TCP is used otherwise)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None, help="engine worker processes (default: all cores)")
+    parser.add_argument("--cache-size", type=int, default=100_000, help="max cached positions")
+    parser.add_argument("--timeout", type=float, default=5.0, help="default per-request timeout in seconds")
+    parser.add_argument("--q-table", action="append", default=[], metavar="[SIZE=]FILE",
+                        help=f"Q-table to serve for a board size (default size {Win_Config.NO_OF_ROWS}), may be repeated")
+    args = parser.parse_args()
+
+    q_table_files = {}
+    for option in args.q_table:
+        size, _, q_table_file = option.rpartition("=")
+        if size and not (size.isdigit() and int(size) in Board.SIZES):
+            parser.error(f"invalid board size in --q-table {option}")
+        q_table_files[int(size) if size else Win_Config.NO_OF_ROWS] = q_table_file
+    try:
+        server = Move_Server(args.workers, args.cache_size, args.timeout, q_table_files)
+    except ValueError as error:
+        parser.error(str(error))
+    try:
+        asyncio.run(server.serve(args.unix, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.executor.shutdown(cancel_futures=True)
+
+if __name__ == '__main__':
+    main()
@@ -1,26 +1,29 @@
+from checkers_env.win_config import Win_Config
 from checkers_env.piece import Piece
 from checkers_env.game import Game
+from checkers_env.game_log import Game_Logger
 from algorithm.minimax import Minimax
 from algorithm.q_learning import Q_Learning
 
-def train(episodes=5000) -> None:
-    """Trains the Q Learning against the Minimax algorithm."""
+def train(episodes=5000, log_file=Game_Logger.LOG_FILE, board_size=Win_Config.NO_OF_ROWS, mandatory_capture=False) -> None:
+    """Trains the Q Learning against the Minimax algorithm (games are appended to log_file)."""
     # Improved epsilon decay: use inverse decay instead of exponential
     epsilon_start = 0.8
     epsilon_end = 0.05
     
     win_counts = {"Q-Learning": 0, "Minimax": 0, "Draw": 0}
     move_counts = []
+    logger = Game_Logger(log_file) if log_file else None
     
     for episode in range(episodes):
         # Inverse decay: epsilon decreases more gradually
         epsilon = epsilon_end + (epsilon_start - epsilon_end) * (1 - episode / episodes)
         epsilon = max(epsilon_end, epsilon)
         
-        game = Game(None)
+        game = Game(None, logger, board_size, mandatory_capture)
         # Increase depth for stronger minimax opponent to better train the Q-learning agent
         minimax = Minimax(depth=2)
-        q_learning = Q_Learning(alpha=0.15, gamma=0.95, epsilon=epsilon)
+        q_learning = Q_Learning(alpha=0.15, gamma=0.95, epsilon=epsilon, board_size=board_size)
 
         while game.winner() is None:
             if game.current_player == Piece.P2:
@@ -59,6 +62,9 @@ def train(episodes=5000) -> None:
         elif (episode + 1) % 10 == 0:
             print(f"Episode {episode + 1}/{episodes} | Winner: {winner_str} | Moves: {moves}")
     
+    if logger:
+        logger.close()
+
     # Print final statistics
     print("\n" + "="*60)
     print("Training completed!")
@@ -68,5 +74,12 @@ def train(episodes=5000) -> None:
     print(f"Average game length: {sum(move_counts)/len(move_counts):.1f} moves")
     print("="*60)
 
+def train_offline(log_file=Game_Logger.LOG_FILE, passes=1, learn_p2=False, alpha=0.15, gamma=0.95, q_table_file=None, board_size=Win_Config.NO_OF_ROWS) -> None:
+    """Trains the Q Learning offline from the games of one board size in a game log (e.g. recorded minimax self-play)."""
+    q_learning = Q_Learning(alpha=alpha, gamma=gamma, q_table_file=q_table_file, board_size=board_size)
+    updates = q_learning.train_from_log(log_file, passes=passes, learn_p2=learn_p2, board_size=board_size)
+    q_learning.save_q_table()
+    print(f"Offline training completed: {updates} Q-value updates over {passes} pass(es) of {log_file}.")
+
 if __name__ == "__main__":
     train(episodes=5000)